@@ -5,21 +5,36 @@ This module provides enhanced security features for ensuring proper isolation
 between different businesses in the file processing workflow.
 """
 
+import asyncio
+import re
+import sys
 import uuid
 import time
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
 from philoagents.domain.business_user import BusinessUser
-from philoagents.domain.business_user_factory import (
-    BusinessUserFactory,
-    DatabaseConnectionError,
-    DatabaseOperationError,
-)
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Matches potentially dangerous filename characters and '..' sequences in one pass
+_FILENAME_SANITIZE_RE = re.compile(r'[/\\<>:"|?*]|\.\.')
+
+# How long a validated token can be reused before hitting the database again
+_TOKEN_TTL = 300.0
+
+# Bounds for the asynchronous audit pipeline
+_AUDIT_QUEUE_MAXSIZE = 20000
+_AUDIT_FLUSH_BATCH_SIZE = 50
+
+# Maximum accepted file size, constant-folded into base64 length so oversize
+# uploads are rejected with one integer compare before any decoding
+_MAX_FILE_BYTES = 5 * 1024 * 1024
+_MAX_FILE_B64_LEN = ((_MAX_FILE_BYTES + 2) // 3) * 4
+
 
 class ValidationResult(Enum):
     """Enumeration for validation results."""
@@ -30,7 +45,7 @@ class ValidationResult(Enum):
     DATABASE_ERROR = "database_error"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BusinessContext:
     """Represents validated business context for file processing."""
     token: str
@@ -39,20 +54,29 @@ class BusinessContext:
     sector: str
     validated_at: float
     validation_id: str
+    _cached_metadata: Optional[Dict[str, Any]] = field(
+        default=None, repr=False, compare=False
+    )
     
     def to_metadata(self) -> Dict[str, Any]:
-        """Convert business context to metadata dictionary."""
-        return {
-            "business_token": self.token,
-            "business_name": self.business_name,
-            "owner_name": self.owner_name,
-            "sector": self.sector,
-            "validated_at": self.validated_at,
-            "validation_id": self.validation_id,
-        }
+        """Convert business context to metadata dictionary.
+
+        The same context is shared by many audit records, so the dictionary is
+        built once and reused (treated as immutable by callers).
+        """
+        if self._cached_metadata is None:
+            object.__setattr__(self, "_cached_metadata", {
+                "business_token": self.token,
+                "business_name": self.business_name,
+                "owner_name": self.owner_name,
+                "sector": self.sector,
+                "validated_at": self.validated_at,
+                "validation_id": self.validation_id,
+            })
+        return self._cached_metadata
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FileProcessingAudit:
     """Audit trail for file processing operations."""
     operation_id: str
@@ -82,9 +106,44 @@ class BusinessValidator:
     """Validates business context and provides security features."""
     
     def __init__(self):
+        # Imported lazily so loading this module doesn't pull in the whole
+        # MongoDB/motor import graph for callers that only need the
+        # validation dataclasses and sanitization helpers
+        from philoagents.domain.business_user_factory import (
+            BusinessUserFactory,
+            DatabaseConnectionError,
+            DatabaseOperationError,
+        )
+
+        self._db_connection_error = DatabaseConnectionError
+        self._db_operation_error = DatabaseOperationError
         self.user_factory = BusinessUserFactory()
-        self._audit_logs: List[FileProcessingAudit] = []
-    
+        # Bounded to the last 1000 audit logs to prevent memory issues
+        self._audit_logs: deque[FileProcessingAudit] = deque(maxlen=1000)
+        self._token_cache: Dict[str, tuple[float, BusinessUser]] = {}
+        self._token_cache_lock = asyncio.Lock()
+        # Audit records are drained off the request path by a background task
+        self._audit_queue: asyncio.Queue[FileProcessingAudit] = asyncio.Queue(
+            maxsize=_AUDIT_QUEUE_MAXSIZE
+        )
+        self._audit_worker_task: Optional[asyncio.Task] = None
+        self._dropped_audits = 0
+        # Running statistics maintained incrementally as records are appended
+        # and evicted, so summaries never rescan the whole audit trail
+        self._total_ops = 0
+        self._success_ops = 0
+        self._business_stats: Dict[str, Dict[str, Any]] = {}
+        self._logs_by_token: Dict[str, deque[FileProcessingAudit]] = {}
+
+    def invalidate_token(self, token: str) -> None:
+        """
+        Remove a token from the validation cache (e.g. after revocation).
+
+        Args:
+            token: The business user token to invalidate
+        """
+        self._token_cache.pop(token, None)
+
     async def validate_business_context(
         self, 
         user_token: Optional[str],
@@ -105,13 +164,28 @@ class BusinessValidator:
             return ValidationResult.TOKEN_MISSING, None
         
         try:
-            # Get user by token
-            user = await self.user_factory.get_user_by_token(user_token)
-            
-            if not user:
-                logger.warning(f"Invalid token provided for {operation_context}: {user_token}")
-                return ValidationResult.INVALID_TOKEN, None
-            
+            # Reuse a recently validated token to skip the database round-trip
+            cached = self._token_cache.get(user_token)
+            if cached and time.time() - cached[0] < _TOKEN_TTL:
+                user = cached[1]
+            else:
+                # Get user by token
+                user = await self.user_factory.get_user_by_token(user_token)
+
+                if not user:
+                    logger.warning(f"Invalid token provided for {operation_context}: {user_token}")
+                    return ValidationResult.INVALID_TOKEN, None
+
+                self._token_cache[user_token] = (time.time(), user)
+                if len(self._token_cache) > 1000:
+                    async with self._token_cache_lock:
+                        now = time.time()
+                        self._token_cache = {
+                            token: entry
+                            for token, entry in self._token_cache.items()
+                            if now - entry[0] < _TOKEN_TTL
+                        }
+
             # Create validated business context
             business_context = BusinessContext(
                 token=user_token,
@@ -119,7 +193,7 @@ class BusinessValidator:
                 owner_name=user.owner_name,
                 sector=user.sector,
                 validated_at=time.time(),
-                validation_id=str(uuid.uuid4())
+                validation_id=uuid.uuid4().hex
             )
             
             logger.info(f"Validated business context for {operation_context}: "
@@ -127,10 +201,10 @@ class BusinessValidator:
             
             return ValidationResult.VALID, business_context
             
-        except DatabaseConnectionError as e:
+        except self._db_connection_error as e:
             logger.error(f"Database connection error during validation: {e}")
             return ValidationResult.DATABASE_ERROR, None
-        except DatabaseOperationError as e:
+        except self._db_operation_error as e:
             logger.error(f"Database operation error during validation: {e}")
             return ValidationResult.VALIDATION_FAILED, None
         except Exception as e:
@@ -169,6 +243,11 @@ class BusinessValidator:
             logger.warning(f"No file data provided for {operation_context}")
             return ValidationResult.VALIDATION_FAILED, None
         
+        if len(file_data) > _MAX_FILE_B64_LEN:
+            logger.warning(f"File too large for {operation_context}: "
+                           f"{len(file_data)} base64 chars (max {_MAX_FILE_B64_LEN})")
+            return ValidationResult.VALIDATION_FAILED, None
+
         if not file_name:
             logger.warning(f"No file name provided for {operation_context}")
             return ValidationResult.VALIDATION_FAILED, None
@@ -191,11 +270,12 @@ class BusinessValidator:
         Returns:
             Sanitized filename
         """
-        # Remove potentially dangerous characters
-        dangerous_chars = ['/', '\\', '..', '<', '>', ':', '"', '|', '?', '*']
-        sanitized = filename
-        for char in dangerous_chars:
-            sanitized = sanitized.replace(char, '_')
+        # Fast path: most filenames are already clean and short
+        if not _FILENAME_SANITIZE_RE.search(filename) and len(filename) <= 255:
+            return filename
+
+        # Remove potentially dangerous characters in a single pass
+        sanitized = _FILENAME_SANITIZE_RE.sub('_', filename)
         
         # Limit length
         if len(sanitized) > 255:
@@ -228,7 +308,7 @@ class BusinessValidator:
         Returns:
             Operation ID for tracking
         """
-        operation_id = str(uuid.uuid4())
+        operation_id = uuid.uuid4().hex
         
         audit_record = FileProcessingAudit(
             operation_id=operation_id,
@@ -241,17 +321,109 @@ class BusinessValidator:
             error_message=error_message
         )
         
-        self._audit_logs.append(audit_record)
-        
-        # Keep only last 1000 audit logs to prevent memory issues
-        if len(self._audit_logs) > 1000:
-            self._audit_logs = self._audit_logs[-1000:]
-        
-        logger.info(f"File processing audit logged: {operation_id} - "
-                   f"{business_context.business_name} - {file_type} - "
-                   f"Success: {success}")
-        
+        try:
+            # Start the worker before enqueueing: with no running event loop
+            # this raises first, so the inline fallback below can't leave a
+            # copy in the queue for a later worker to record a second time
+            self._ensure_audit_worker()
+            self._audit_queue.put_nowait(audit_record)
+        except RuntimeError:
+            # No running event loop (e.g. synchronous callers); record inline
+            self._record_audit(audit_record)
+        except asyncio.QueueFull:
+            # Audit logging must never block the request path; drop and count
+            self._dropped_audits += 1
+
         return operation_id
+
+    def _ensure_audit_worker(self) -> None:
+        """Lazily start the background audit worker on the running loop."""
+        if self._audit_worker_task is None or self._audit_worker_task.done():
+            self._audit_worker_task = asyncio.get_running_loop().create_task(
+                self._audit_worker()
+            )
+
+    async def _audit_worker(self) -> None:
+        """Drain queued audit records in batches off the request path."""
+        while True:
+            batch = [await self._audit_queue.get()]
+            while len(batch) < _AUDIT_FLUSH_BATCH_SIZE:
+                try:
+                    batch.append(self._audit_queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            for audit_record in batch:
+                self._record_audit(audit_record)
+
+    def _record_audit(self, audit_record: FileProcessingAudit) -> None:
+        """Append an audit record to the in-memory trail and log it."""
+        # Retire the oldest record's statistics before the deque evicts it
+        if len(self._audit_logs) == self._audit_logs.maxlen:
+            self._evict_audit(self._audit_logs[0])
+
+        self._audit_logs.append(audit_record)
+
+        self._total_ops += 1
+        if audit_record.success:
+            self._success_ops += 1
+
+        business_name = audit_record.business_context.business_name
+        stats = self._business_stats.setdefault(business_name, {
+            "total_operations": 0,
+            "successful_operations": 0,
+            "failed_operations": 0,
+            "file_types": {},
+        })
+        stats["total_operations"] += 1
+        file_types = stats["file_types"]
+        file_types[audit_record.file_type] = file_types.get(audit_record.file_type, 0) + 1
+        if audit_record.success:
+            stats["successful_operations"] += 1
+        else:
+            stats["failed_operations"] += 1
+
+        # Interned so repeated lookups reduce to pointer comparisons
+        token = sys.intern(audit_record.business_context.token)
+        self._logs_by_token.setdefault(token, deque()).append(audit_record)
+
+        logger.info(f"File processing audit logged: {audit_record.operation_id} - "
+                   f"{audit_record.business_context.business_name} - "
+                   f"{audit_record.file_type} - "
+                   f"Success: {audit_record.success}")
+
+    def _evict_audit(self, audit_record: FileProcessingAudit) -> None:
+        """Roll an evicted record out of the running statistics."""
+        self._total_ops -= 1
+        if audit_record.success:
+            self._success_ops -= 1
+
+        business_name = audit_record.business_context.business_name
+        stats = self._business_stats.get(business_name)
+        if stats:
+            stats["total_operations"] -= 1
+            if audit_record.success:
+                stats["successful_operations"] -= 1
+            else:
+                stats["failed_operations"] -= 1
+
+            file_types = stats["file_types"]
+            count = file_types.get(audit_record.file_type, 0) - 1
+            if count > 0:
+                file_types[audit_record.file_type] = count
+            else:
+                file_types.pop(audit_record.file_type, None)
+
+            if stats["total_operations"] <= 0:
+                del self._business_stats[business_name]
+
+        token = audit_record.business_context.token
+        token_logs = self._logs_by_token.get(token)
+        if token_logs:
+            # Records evict in insertion order, so the oldest entry matches
+            token_logs.popleft()
+            if not token_logs:
+                del self._logs_by_token[token]
     
     def get_audit_logs_for_business(self, business_token: str) -> List[Dict[str, Any]]:
         """
@@ -263,11 +435,10 @@ class BusinessValidator:
         Returns:
             List of audit log dictionaries
         """
-        business_logs = [
-            log.to_dict() for log in self._audit_logs 
-            if log.business_context.token == business_token
-        ]
-        return business_logs
+        business_logs = self._logs_by_token.get(business_token)
+        if not business_logs:
+            return []
+        return [log.to_dict() for log in business_logs]
     
     def get_audit_summary(self) -> Dict[str, Any]:
         """
@@ -276,36 +447,22 @@ class BusinessValidator:
         Returns:
             Dictionary with audit summary
         """
-        total_operations = len(self._audit_logs)
-        successful_operations = sum(1 for log in self._audit_logs if log.success)
+        total_operations = self._total_ops
+        successful_operations = self._success_ops
         failed_operations = total_operations - successful_operations
-        
-        # Group by business
-        business_stats = {}
-        for log in self._audit_logs:
-            business_name = log.business_context.business_name
-            if business_name not in business_stats:
-                business_stats[business_name] = {
-                    "total_operations": 0,
-                    "successful_operations": 0,
-                    "failed_operations": 0,
-                    "file_types": set()
-                }
-            
-            stats = business_stats[business_name]
-            stats["total_operations"] += 1
-            stats["file_types"].add(log.file_type)
-            if log.success:
-                stats["successful_operations"] += 1
-            else:
-                stats["failed_operations"] += 1
-        
-        # Convert sets to lists for JSON serialization
-        for business_name in business_stats:
-            business_stats[business_name]["file_types"] = list(
-                business_stats[business_name]["file_types"]
-            )
-        
+
+        # Statistics are maintained incrementally; only the file-type counters
+        # need converting to lists for JSON serialization
+        business_stats = {
+            business_name: {
+                "total_operations": stats["total_operations"],
+                "successful_operations": stats["successful_operations"],
+                "failed_operations": stats["failed_operations"],
+                "file_types": list(stats["file_types"]),
+            }
+            for business_name, stats in self._business_stats.items()
+        }
+
         return {
             "total_operations": total_operations,
             "successful_operations": successful_operations,
@@ -316,5 +473,19 @@ class BusinessValidator:
         }
 
 
-# Global validator instance
-business_validator = BusinessValidator()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_business_validator() -> BusinessValidator:
+    """Build (once) the process-wide validator instance."""
+    return BusinessValidator()
+
+
+def __getattr__(name: str):
+    """Resolve the module-level `business_validator` singleton lazily.
+
+    Constructing BusinessValidator pulls in the MongoDB/motor import graph,
+    so it is deferred until the first attribute access instead of running as
+    an import side effect (same pattern as `graph` in workflow/graph.py).
+    """
+    if name == "business_validator":
+        return get_business_validator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,5 +1,7 @@
+import sys
+import threading
 import uuid
-from typing import Any, AsyncGenerator, Union, Dict, Optional
+from typing import Any, AsyncGenerator, Union, Dict, Optional, cast
 from philoagents.config import settings
 from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
 from langgraph.checkpoint.mongodb import MongoDBSaver
@@ -8,9 +10,89 @@ from philoagents.application.conversation_service.workflow.graph import (
     create_business_workflow_graph,
 )
 from philoagents.application.conversation_service.workflow.state import BusinessCanvasState
+from pymongo import MongoClient
+
+__all__ = ["get_business_response", "get_business_streaming_response"]
 
 # checkpointer = InMemorySaver()
 
+# Node whose message chunks are surfaced to streaming clients
+_STREAM_TARGET_NODE = "business_conversation_node"
+
+# The graph structure is static and the checkpointer can be shared, so compile
+# once at first use instead of rebuilding identical LangGraph state per request
+_compiled_graph = None
+_compiled_graph_lock = threading.Lock()
+
+
+def _get_compiled_graph():
+    """Return the process-wide compiled workflow graph, building it lazily."""
+    global _compiled_graph
+    if _compiled_graph is None:
+        with _compiled_graph_lock:
+            if _compiled_graph is None:  # Double-check pattern
+                checkpointer = MongoDBSaver(
+                    MongoClient(settings.MONGODB_URI),
+                    db_name=settings.MONGODB_DB_NAME,
+                    checkpoint_collection_name=settings.MONGO_STATE_CHECKPOINT_COLLECTION,
+                    writes_collection_name=settings.MONGO_STATE_WRITES_COLLECTION,
+                    ttl=3600,
+                )
+                _compiled_graph = create_business_workflow_graph().compile(
+                    checkpointer=checkpointer
+                )
+    return _compiled_graph
+
+
+def _build_config(expert_id: str, user_token: str, new_thread: bool) -> dict:
+    """Build the LangGraph run config with a per-expert, per-user thread ID."""
+    # Generate thread ID using expert ID and user token
+    thread_id = f"{expert_id}:{user_token}"
+
+    # Append UUID if starting new thread
+    if new_thread:
+        thread_id = f"{thread_id}:{uuid.uuid4().hex}"
+    else:
+        # Continuing threads rebuild the same ID every turn; intern it so the
+        # config key reuses one string object across calls
+        thread_id = sys.intern(thread_id)
+
+    return {
+        "configurable": {"thread_id": thread_id},
+    }
+
+
+def _build_workflow_input(
+    formatted_messages: list[Union[HumanMessage, AIMessage]],
+    expert_context: str,
+    expert_name: str,
+    expert_domain: str,
+    expert_perspective: str,
+    expert_style: str,
+    user_context: Optional[Dict[str, Any]],
+    user_token: str,
+    pdf_base64: Optional[str] = None,
+    image_base64: Optional[str] = None,
+    pdf_name: Optional[str] = None,
+    file_processing_completed: bool = False,
+) -> dict:
+    """Build the initial workflow state shared by both entrypoints."""
+    return {
+        "messages": formatted_messages,
+        "expert_context": expert_context,
+        "expert_name": expert_name,
+        "expert_domain": expert_domain,
+        "expert_perspective": expert_perspective,
+        "expert_style": expert_style,
+        "user_context": user_context,
+        "user_token": user_token,  # Include for business security validation
+        "summary": "",
+        "pdf_base64": pdf_base64,
+        "image_base64": image_base64,
+        "pdf_name": pdf_name,
+        "file_processing_completed": file_processing_completed,
+    }
+
 async def get_business_response(
     messages: str | list[str] | list[dict[str, Any]],
     expert_id: str,
@@ -50,58 +132,39 @@ async def get_business_response(
         RuntimeError: If there's an error running the conversation workflow.
     """
 
-    graph_builder = create_business_workflow_graph()
-
     try:
-        with MongoDBSaver.from_conn_string(
-            conn_string=settings.MONGODB_URI, 
-            db_name=settings.MONGODB_DB_NAME, 
-            checkpoint_collection_name=settings.MONGO_STATE_CHECKPOINT_COLLECTION, 
-            writes_collection_name=settings.MONGO_STATE_WRITES_COLLECTION,
-            ttl=3600,
-        ) as checkpointer:
-            graph = graph_builder.compile(checkpointer=checkpointer)
-
-            # Generate thread ID using expert ID and user token
-            thread_id = f"{expert_id}:{user_token}"
-            
-            # Append UUID if starting new thread
-            if new_thread:
-                thread_id = f"{thread_id}:{uuid.uuid4()}"
-            config = {
-                "configurable": {"thread_id": thread_id},
-            }
-
-            # Format messages - file processing now happens inside the workflow
-            formatted_messages = __format_messages(messages=messages)
-            
-            # File processing is now handled inside the LangGraph workflow for unified tracing
-            # Pass file data as part of the workflow state instead of processing outside
-            workflow_input = {
-                "messages": formatted_messages,
-                "expert_context": expert_context,
-                "expert_name": expert_name,
-                "expert_domain": expert_domain,
-                "expert_perspective": expert_perspective,
-                "expert_style": expert_style,
-                "user_context": user_context,
-                "user_token": user_token,  # Include for business security validation
-                "summary": "",
-                "pdf_base64": pdf_base64,
-                "image_base64": image_base64,
-                "pdf_name": pdf_name,
-                "file_processing_completed": False,  # Start with files unprocessed
-            }
-            
-            # The LangGraph workflow execution will be automatically traced by LangSmith
-            # All file processing will be nested within this main trace
-            output_state = await graph.ainvoke(
-                input=workflow_input,
-                config=config, # type: ignore
-            )
-            last_message = output_state["messages"][-1]
-            
-            return last_message.content, BusinessCanvasState(**output_state)
+        graph = _get_compiled_graph()
+        config = _build_config(expert_id, user_token, new_thread)
+
+        # File processing is now handled inside the LangGraph workflow for unified tracing
+        # Pass file data as part of the workflow state instead of processing outside
+        workflow_input = _build_workflow_input(
+            formatted_messages=__format_messages(messages=messages, only_last=not new_thread),
+            expert_context=expert_context,
+            expert_name=expert_name,
+            expert_domain=expert_domain,
+            expert_perspective=expert_perspective,
+            expert_style=expert_style,
+            user_context=user_context,
+            user_token=user_token,
+            pdf_base64=pdf_base64,
+            image_base64=image_base64,
+            pdf_name=pdf_name,
+            file_processing_completed=False,  # Start with files unprocessed
+        )
+
+        # The LangGraph workflow execution will be automatically traced by LangSmith
+        # All file processing will be nested within this main trace
+        output_state = await graph.ainvoke(
+            input=workflow_input,
+            config=config, # type: ignore
+            durability="exit",  # Checkpoint once per run, not after every node
+        )
+        last_message = output_state["messages"][-1]
+
+        # BusinessCanvasState is a TypedDict, so the output state can be
+        # returned as-is instead of copying every field into a new dict
+        return last_message.content, cast(BusinessCanvasState, output_state)
     except Exception as e:
         raise RuntimeError(f"Error running business conversation workflow: {str(e)}") from e
 
@@ -138,52 +201,33 @@ async def get_business_streaming_response(
     Raises:
         RuntimeError: If there's an error running the conversation workflow.
     """
-    graph_builder = create_business_workflow_graph()
-
     try:
-        with MongoDBSaver.from_conn_string(
-            conn_string=settings.MONGODB_URI,
-            db_name=settings.MONGODB_DB_NAME,
-            checkpoint_collection_name=settings.MONGO_STATE_CHECKPOINT_COLLECTION,
-            writes_collection_name=settings.MONGO_STATE_WRITES_COLLECTION,
-        ) as checkpointer:
-            graph = graph_builder.compile(checkpointer=checkpointer)
-
-            # Generate thread ID using expert ID and user token
-            thread_id = f"{expert_id}:{user_token}"
-            
-            # Append UUID if starting new thread
-            if new_thread:
-                thread_id = f"{thread_id}:{uuid.uuid4()}"
-            config = {
-                "configurable": {"thread_id": thread_id},
-            }
-
-            # Streaming workflow execution will be automatically traced by LangGraph
-            # Note: File processing is not supported in streaming mode for simplicity
-            async for chunk in graph.astream(
-                input={
-                    "messages": __format_messages(messages=messages),
-                    "expert_context": expert_context,
-                    "expert_name": expert_name,
-                    "expert_domain": expert_domain,
-                    "expert_perspective": expert_perspective,
-                    "expert_style": expert_style,
-                    "user_context": user_context,
-                    "user_token": user_token,  # Include for business security validation
-                    "summary": "",
-                    "pdf_base64": None,  # File processing not supported in streaming
-                    "image_base64": None,
-                    "pdf_name": None,
-                    "file_processing_completed": True,
-                },
-                config=config, # type: ignore
-                stream_mode="messages",
+        graph = _get_compiled_graph()
+        config = _build_config(expert_id, user_token, new_thread)
+
+        # Streaming workflow execution will be automatically traced by LangGraph
+        # Note: File processing is not supported in streaming mode for simplicity
+        async for message, metadata in graph.astream(
+            input=_build_workflow_input(
+                formatted_messages=__format_messages(messages=messages, only_last=not new_thread),
+                expert_context=expert_context,
+                expert_name=expert_name,
+                expert_domain=expert_domain,
+                expert_perspective=expert_perspective,
+                expert_style=expert_style,
+                user_context=user_context,
+                user_token=user_token,
+                file_processing_completed=True,  # File processing not supported in streaming
+            ),
+            config=config, # type: ignore
+            stream_mode="messages",
+            durability="exit",  # Checkpoint once per run, not after every node
+        ):
+            if (
+                metadata["langgraph_node"] == _STREAM_TARGET_NODE # type: ignore
+                and type(message) is AIMessageChunk
             ):
-                if chunk[1]["langgraph_node"] == "business_conversation_node" and isinstance( # type: ignore
-                    chunk[0], AIMessageChunk # type: ignore
-                ):
-                    yield chunk[0].content # type: ignore
+                yield message.content # type: ignore
 
     except Exception as e:
         raise RuntimeError(
@@ -191,8 +235,13 @@ async def get_business_streaming_response(
         ) from e
 
 
+# Maps message roles to their LangChain message classes for __format_messages
+_ROLE_TO_CLASS = {"user": HumanMessage, "assistant": AIMessage}
+
+
 def __format_messages(
     messages: Union[str, list[str], list[dict[str, Any]]],
+    only_last: bool = False,
 ) -> list[Union[HumanMessage, AIMessage]]:
     """Convert various message formats to a list of LangChain message objects.
 
@@ -201,18 +250,23 @@ def __format_messages(
             - A single string message
             - A list of string messages
             - A list of dictionaries with 'role' and 'content' keys
+        only_last: When True, only convert the newest message. Use on
+            continuing threads where the checkpointer already holds history.
 
     Returns:
         List[Union[HumanMessage, AIMessage]]: A list of LangChain message objects
     """
 
-    if isinstance(messages, str):
+    if type(messages) is str:
         return [HumanMessage(content=messages)]
 
     if isinstance(messages, list):
         if not messages:
             return []
 
+        if only_last:
+            messages = messages[-1:]
+
         # Check if it's a list of dictionaries with role/content
         if (
             isinstance(messages[0], dict)
@@ -221,10 +275,12 @@ def __format_messages(
         ):
             result = []
             for msg in messages:
-                if msg["role"] == "user": # type: ignore
-                    result.append(HumanMessage(content=str(msg["content"]))) # type: ignore
-                elif msg["role"] == "assistant": # type: ignore
-                    result.append(AIMessage(content=str(msg["content"]))) # type: ignore
+                message_class = _ROLE_TO_CLASS.get(msg["role"]) # type: ignore
+                if message_class is not None:
+                    content = msg["content"] # type: ignore
+                    if type(content) is not str:
+                        content = str(content)
+                    result.append(message_class(content=content))
             return result
 
         # Otherwise treat as list of strings
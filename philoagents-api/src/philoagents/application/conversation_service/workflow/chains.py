@@ -1,3 +1,7 @@
+from functools import lru_cache
+
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 # from langchain_groq import ChatGroq
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -11,7 +15,17 @@ from philoagents.domain.prompts import (
 )
 
 
+# Short-circuit repeated (prompt, model, temperature) calls before the HTTP
+# request — identical prompts resolve from memory instead of hitting Gemini.
+# Bounded: keys embed the full rendered prompt (history, summary, user
+# context), so unique entries would otherwise accumulate for the process
+# lifetime; repeats mostly come from client retries of the latest turn
+set_llm_cache(InMemoryCache(maxsize=256))
+
+
+@lru_cache(maxsize=4)
 def get_chat_model(temperature: float = 0.7, model_name: str = settings.GEMINI_LLM_MODEL) -> ChatGoogleGenerativeAI:
+    """Return a shared chat model so the underlying client is reused."""
     return ChatGoogleGenerativeAI(
         api_key=settings.GEMINI_API_KEY,
         model=model_name, # type: ignore
@@ -19,35 +33,88 @@ def get_chat_model(temperature: float = 0.7, model_name: str = settings.GEMINI_L
     )
 
 
+# Prompt templates are pure functions of the prompt strings, so the Jinja
+# compilation runs once at import instead of on every turn
+_EXPERT_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        ("system", BUSINESS_EXPERT_CHARACTER_CARD.prompt),
+        MessagesPlaceholder(variable_name="messages"),
+    ],
+    template_format="jinja2",
+)
+
+_SUMMARY_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        MessagesPlaceholder(variable_name="messages"),
+        ("human", SUMMARY_PROMPT.prompt),
+    ],
+    template_format="jinja2",
+)
+
+_EXTEND_SUMMARY_PROMPT = ChatPromptTemplate.from_messages(
+    [
+        MessagesPlaceholder(variable_name="messages"),
+        ("human", EXTEND_SUMMARY_PROMPT.prompt),
+    ],
+    template_format="jinja2",
+)
+
+
+@lru_cache(maxsize=1)
 def get_business_expert_response_chain():
     """Chain for business canvas expert conversations."""
-    model = get_chat_model()
     # Remove tools binding since we're simplifying to no long-term memory
-    system_message = BUSINESS_EXPERT_CHARACTER_CARD
-
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", system_message.prompt),
-            MessagesPlaceholder(variable_name="messages"),
-        ],
-        template_format="jinja2",
+    return _EXPERT_PROMPT | get_chat_model()
+
+
+@lru_cache(maxsize=32)
+def get_expert_response_chain_for(
+    expert_context: str,
+    expert_name: str,
+    expert_domain: str,
+    expert_perspective: str,
+    expert_style: str,
+):
+    """Chain with the static expert fields pre-bound as prompt partials.
+
+    The expert roster is small and fixed, so each expert's chain is built once;
+    per-turn invocations then only substitute messages, summary and the user
+    context section.
+    """
+    return (
+        _EXPERT_PROMPT.partial(
+            expert_context=expert_context,
+            expert_name=expert_name,
+            expert_domain=expert_domain,
+            expert_perspective=expert_perspective,
+            expert_style=expert_style,
+        )
+        | get_chat_model()
     )
 
-    return prompt | model
+
+async def run_expert_chain_batch(inputs: list[dict], max_concurrency: int = 10):
+    """Run independent expert-chain inputs as one bounded parallel batch.
+
+    Intended for offline / fan-out scenarios (e.g. regenerating several canvas
+    sections at once) where sequential ainvoke calls would serialize the LLM
+    round-trips.
+    """
+    return await get_business_expert_response_chain().abatch(
+        inputs, config={"max_concurrency": max_concurrency}
+    )
 
 
 def get_business_conversation_summary_chain(summary: str = ""):
     """Summary chain for business expert conversations."""
-    model = get_chat_model(model_name=settings.GEMINI_LLM_MODEL_CONTEXT_SUMMARY) # type: ignore
+    return _get_summary_chain(bool(summary))
 
-    summary_message = EXTEND_SUMMARY_PROMPT if summary else SUMMARY_PROMPT
 
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            MessagesPlaceholder(variable_name="messages"),
-            ("human", summary_message.prompt),
-        ],
-        template_format="jinja2",
-    )
+@lru_cache(maxsize=2)
+def _get_summary_chain(has_summary: bool):
+    """Build (once per variant) the summary chain on the smaller model."""
+    model = get_chat_model(model_name=settings.GEMINI_LLM_MODEL_CONTEXT_SUMMARY) # type: ignore
+
+    prompt = _EXTEND_SUMMARY_PROMPT if has_summary else _SUMMARY_PROMPT
 
     return prompt | model
@@ -38,22 +38,35 @@ def create_business_workflow_graph():
     graph_builder.add_node("business_conversation_node", business_conversation_node)
     graph_builder.add_node("business_summarize_conversation_node", business_summarize_conversation_node)
 
-    # Define the business workflow flow
-    graph_builder.add_edge(START, "file_processing_node")
+    # Define the business workflow flow. Routing on files happens at START so
+    # the common no-files turn skips the file processing node hop entirely.
     graph_builder.add_conditional_edges(
-        "file_processing_node", 
+        START,
         has_files_to_process,
         {
-            "file_processing": "business_conversation_node",  # Process files then go to conversation
-            "business_conversation": "business_conversation_node"  # Skip file processing, go directly to conversation
+            "file_processing": "file_processing_node",  # Validate files first
+            "business_conversation": "business_conversation_node"  # No files, go directly to conversation
         }
     )
+    graph_builder.add_edge("file_processing_node", "business_conversation_node")
     graph_builder.add_conditional_edges("business_conversation_node", should_summarize_business_conversation)
     graph_builder.add_edge("business_summarize_conversation_node", END)
     
     return graph_builder
 
 
-# Primary graph for Business Model Canvas 
-graph = create_business_workflow_graph().compile()
+@lru_cache(maxsize=1)
+def get_compiled_business_workflow_graph():
+    """Compile the workflow graph once and reuse it for every caller."""
+    return create_business_workflow_graph().compile()
+
+
+def __getattr__(name: str):
+    # Primary graph for Business Model Canvas (referenced as graph.py:graph by
+    # langgraph.json). Resolved lazily so importing this module — e.g. from the
+    # API service, which compiles with its own checkpointer — doesn't pay for
+    # an extra compile at import time.
+    if name == "graph":
+        return get_compiled_business_workflow_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
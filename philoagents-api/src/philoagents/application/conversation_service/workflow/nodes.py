@@ -1,10 +1,18 @@
-from langchain_core.messages import RemoveMessage
+import asyncio
+import base64
+import hashlib
+import io
+import time
+from functools import lru_cache
+from itertools import islice
+
+from langchain_core.messages import HumanMessage, RemoveMessage, trim_messages
 from langchain_core.runnables import RunnableConfig
 from langgraph.prebuilt import ToolNode
 
 from philoagents.application.conversation_service.workflow.chains import (
     get_business_conversation_summary_chain,
-    get_business_expert_response_chain,
+    get_expert_response_chain_for,
 )
 
 from philoagents.application.conversation_service.workflow.state import BusinessCanvasState
@@ -12,23 +20,233 @@ from philoagents.config import settings
 from philoagents.domain.business_user_factory import BusinessUserFactory
 from philoagents.domain.business_user import BusinessUser
 from philoagents.application.conversation_service.business_security import (
+    _MAX_FILE_B64_LEN,
     business_validator,
     ValidationResult,
     BusinessContext,
 )
 from loguru import logger
 
+# Uploaded file handles keyed by content hash, so a PDF the user keeps asking
+# about is sent to the Gemini File API once instead of inlined on every turn.
+# TTL matches the Gemini File API's 48h retention window.
+_FILE_URI_TTL = 48 * 3600.0
+_file_uri_cache: dict[str, tuple[float, str]] = {}
+
+
+@lru_cache(maxsize=1)
+def _get_genai_client():
+    """Lazily create the shared google-genai client for file uploads."""
+    from google import genai
+
+    return genai.Client(api_key=settings.GEMINI_API_KEY)
+
+
+# Payloads past this size have their digest computed off the event loop
+_HASH_OFFLOAD_THRESHOLD = 1 << 20  # 1 MiB of base64
+
+
+async def _payload_digest(b64_string: str) -> str:
+    """Cache key for a file payload.
+
+    Hashing a multi-MB base64 string takes tens of milliseconds; above the
+    threshold it runs in a worker thread so concurrent requests aren't
+    stalled behind it.
+    """
+    def digest() -> str:
+        return hashlib.blake2b(b64_string.encode("ascii"), digest_size=16).hexdigest()
+
+    if len(b64_string) < _HASH_OFFLOAD_THRESHOLD:
+        return digest()
+    return await asyncio.to_thread(digest)
+
+
+async def _upload_pdf_once(pdf_base64: str) -> str | None:
+    """Upload a PDF to the Gemini File API, reusing the URI for repeat sends.
+
+    Returns the file URI, or None if the upload fails (callers should fall
+    back to inlining the base64 payload).
+    """
+    cache_key = await _payload_digest(pdf_base64)
+    cached = _file_uri_cache.get(cache_key)
+    if cached and time.time() - cached[0] < _FILE_URI_TTL:
+        return cached[1]
+
+    try:
+        client = _get_genai_client()
+        # The upload is a synchronous HTTP call; keep it off the event loop
+        uploaded = await asyncio.to_thread(
+            client.files.upload,
+            file=io.BytesIO(base64.b64decode(pdf_base64)),
+            config={"mime_type": "application/pdf"},
+        )
+        now = time.time()
+        # Drop entries past the retention window on write, so keys for PDFs
+        # that are never re-sent don't accumulate for the process lifetime
+        for key in [
+            key
+            for key, (uploaded_at, _) in _file_uri_cache.items()
+            if now - uploaded_at >= _FILE_URI_TTL
+        ]:
+            del _file_uri_cache[key]
+        _file_uri_cache[cache_key] = (now, uploaded.uri)
+        return uploaded.uri
+    except Exception as e:
+        logger.warning("Gemini File API upload failed, inlining PDF instead: {}", e)
+        return None
+
+
+@lru_cache(maxsize=8)
+def _inline_pdf_part(b64_string: str) -> dict:
+    """Build (and cache) the inline content part for a PDF payload.
+
+    Reused when the same PDF is re-sent across turns; treated as read-only
+    by the chain, so sharing the dict is safe.
+    """
+    return {
+        "type": "file",
+        "base64": b64_string,
+        "mime_type": "application/pdf",
+    }
+
+
+@lru_cache(maxsize=8)
+def _image_data_url(b64_string: str) -> str:
+    """Build (and cache) the data URL for an image payload.
+
+    Image data URLs are typically hundreds of KB, and the UI resends the same
+    image on repeat turns, so caching avoids re-concatenating the string.
+    """
+    return f"data:image/png;base64,{b64_string}"
+
+
+async def _build_content_parts(
+    text: str, pdf_base64: str | None, image_base64: str | None
+) -> list[dict]:
+    """Build the full multimodal content list in one pass.
+
+    The file parts come from the memoized helpers above, so only the text part
+    dict is allocated per turn.
+    """
+    parts = [{"type": "text", "text": text}]
+
+    if pdf_base64:
+        file_uri = await _upload_pdf_once(pdf_base64)
+        if file_uri:
+            parts.append({
+                "type": "media",
+                "file_uri": file_uri,
+                "mime_type": "application/pdf",
+            })
+        else:
+            parts.append(_inline_pdf_part(pdf_base64))
+
+    if image_base64:
+        parts.append({
+            "type": "image_url",
+            "image_url": _image_data_url(image_base64),
+        })
+
+    return parts
+
+
+@lru_cache(maxsize=256)
+def _format_user_context_cached(context_items: tuple) -> str:
+    """Build the formatted user-context section for a stable profile.
+
+    The profile dict is identical on every turn of a session, so the Pydantic
+    validation and string formatting run once per profile rather than per turn.
+    """
+    user = BusinessUser(**dict(context_items))
+    return BusinessUserFactory.format_user_context(user)
+
+
+def _get_user_context_section(user_context_data: dict | None) -> str:
+    """Resolve the user-context prompt section, caching per profile."""
+    if not user_context_data:
+        return BusinessUserFactory.format_user_context(None)
+
+    try:
+        # List fields (challenges, goals) become tuples so the key is hashable;
+        # Pydantic coerces them back when the model is built
+        context_items = tuple(
+            sorted(
+                (key, tuple(value) if isinstance(value, list) else value)
+                for key, value in user_context_data.items()
+            )
+        )
+        return _format_user_context_cached(context_items)
+    except Exception as e:
+        logger.error("Error reconstructing BusinessUser in workflow node: {}", e)
+        return "You're speaking with a business owner seeking guidance."
+
+
+def _b64_decoded_size(b64_string: str | None) -> int:
+    """True byte size of a base64 payload, without decoding it."""
+    if not b64_string:
+        return 0
+    return len(b64_string) * 3 // 4 - b64_string[-2:].count("=")
+
+
+def _extract_text(message) -> str:
+    """Return the text of a message, short-circuiting the plain-string case."""
+    content = getattr(message, "content", "")
+    if type(content) is str:
+        return content
+    if isinstance(content, list):
+        return next(
+            (
+                part["text"]
+                for part in content
+                if isinstance(part, dict) and part.get("type") == "text"
+            ),
+            "",
+        )
+    return ""
+
+
 def _sanitize_base64(b64_string: str | None) -> str | None:
     """Sanitize base64 string, handling Swagger placeholders and padding."""
     if not b64_string or b64_string == "string":
         return None
     
-    # Fix padding if needed
-    missing_padding = len(b64_string) % 4
-    if missing_padding:
-        b64_string += "=" * (4 - missing_padding)
+    # Fix padding if needed; -len & 3 is (4 - len % 4) % 4, so correctly
+    # padded payloads take the no-copy fast path
+    pad = -len(b64_string) & 3
+    if pad:
+        b64_string += "=" * pad
     return b64_string
 
+def _audit_files(
+    business_context: BusinessContext,
+    pdf_base64: str | None,
+    image_base64: str | None,
+    pdf_name: str | None,
+    *,
+    success: bool,
+    error_message: str | None = None,
+) -> None:
+    """Emit audit records for whichever file payloads are present."""
+    if pdf_base64:
+        business_validator.log_file_processing_audit(
+            business_context=business_context,
+            file_type="pdf",
+            file_name=pdf_name,
+            file_size=_b64_decoded_size(pdf_base64),
+            success=success,
+            error_message=error_message,
+        )
+    if image_base64:
+        business_validator.log_file_processing_audit(
+            business_context=business_context,
+            file_type="image",
+            file_name="image",
+            file_size=_b64_decoded_size(image_base64),
+            success=success,
+            error_message=error_message,
+        )
+
+
 async def file_processing_node(state: BusinessCanvasState):
     """Handle PDF and image processing validation within the LangGraph workflow.
     
@@ -39,12 +257,54 @@ async def file_processing_node(state: BusinessCanvasState):
     image_base64 = _sanitize_base64(state.get("image_base64"))
     pdf_name = state.get("pdf_name")
     user_token = state.get("user_token")
+
+    # Truthiness computed once and reused below (branching and logging)
+    has_pdf = pdf_base64 is not None
+    has_image = image_base64 is not None
+
+    # Enforce the size cap with one integer compare per payload, before any
+    # validation, decode, or upload work happens on an oversize file
+    oversize = []
+    if has_pdf and len(pdf_base64) > _MAX_FILE_B64_LEN:
+        logger.warning(
+            "Rejecting oversize PDF: {} base64 chars (max {})",
+            len(pdf_base64),
+            _MAX_FILE_B64_LEN,
+        )
+        oversize.append("pdf")
+        pdf_base64 = None
+        has_pdf = False
+    if has_image and len(image_base64) > _MAX_FILE_B64_LEN:
+        logger.warning(
+            "Rejecting oversize image: {} base64 chars (max {})",
+            len(image_base64),
+            _MAX_FILE_B64_LEN,
+        )
+        oversize.append("image")
+        image_base64 = None
+        has_image = False
+
+    oversize_update = (
+        {"file_processing_error": f"File too large: {', '.join(oversize)}"}
+        if oversize
+        else {}
+    )
+
+    # If no files to process, just mark as completed. Write the sanitized
+    # values back so placeholders like "string" don't linger in state.
+    if not has_pdf and not has_image:
+        return {
+            "file_processing_completed": True,
+            "pdf_base64": pdf_base64,
+            "image_base64": image_base64,
+            **oversize_update,
+        }
     
-    # If no files to process, just mark as completed
-    if not pdf_base64 and not image_base64:
-        return {"file_processing_completed": True}
-    
-    logger.info(f"Validating file access in LangGraph workflow: PDF={bool(pdf_base64)}, Image={bool(image_base64)}")
+    logger.info(
+        "Validating file access in LangGraph workflow: PDF={}, Image={}",
+        has_pdf,
+        has_image,
+    )
     
     # Validate business context before processing files
     validation_result, business_context = await business_validator.validate_business_context(
@@ -52,60 +312,38 @@ async def file_processing_node(state: BusinessCanvasState):
     )
     
     if validation_result != ValidationResult.VALID:
-        logger.error(f"Business validation failed in file processing node: {validation_result}")
+        logger.error("Business validation failed in file processing node: {}", validation_result)
         # Log failed attempt for audit
         if business_context:
-            file_sizes = {
-                "pdf": len(pdf_base64) if pdf_base64 else 0,
-                "image": len(image_base64) if image_base64 else 0
-            }
-            
-            if pdf_base64:
-                business_validator.log_file_processing_audit(
-                    business_context=business_context,
-                    file_type="pdf",
-                    file_name=pdf_name,
-                    file_size=file_sizes["pdf"],
-                    success=False,
-                    error_message=f"Validation failed: {validation_result}"
-                )
-            if image_base64:
-                business_validator.log_file_processing_audit(
-                    business_context=business_context,
-                    file_type="image",
-                    file_name="image",
-                    file_size=file_sizes["image"],
-                    success=False,
-                    error_message=f"Validation failed: {validation_result}"
-                )
+            _audit_files(
+                business_context,
+                pdf_base64,
+                image_base64,
+                pdf_name,
+                success=False,
+                error_message=f"Validation failed: {validation_result}",
+            )
         
         # Continue workflow but mark processing as failed
         return {
             "file_processing_completed": True,
-            "file_processing_error": f"Business validation failed: {validation_result}"
+            "file_processing_error": f"Business validation failed: {validation_result}",
+            "pdf_base64": pdf_base64,
+            "image_base64": image_base64,
         }
     
     # Log successful validation/access
     if business_context:
-        if pdf_base64:
-            business_validator.log_file_processing_audit(
-                business_context=business_context,
-                file_type="pdf",
-                file_name=pdf_name,
-                file_size=len(pdf_base64),
-                success=True
-            )
-        if image_base64:
-            business_validator.log_file_processing_audit(
-                business_context=business_context,
-                file_type="image",
-                file_name="image",
-                file_size=len(image_base64),
-                success=True
-            )
+        _audit_files(business_context, pdf_base64, image_base64, pdf_name, success=True)
 
-    # Mark file processing as completed (validation passed)
-    return {"file_processing_completed": True}
+    # Mark file processing as completed (validation passed). The sanitized
+    # payloads are persisted so downstream nodes can use them as-is.
+    return {
+        "file_processing_completed": True,
+        "pdf_base64": pdf_base64,
+        "image_base64": image_base64,
+        **oversize_update,
+    }
 
 
 async def business_conversation_node(state: BusinessCanvasState, config: RunnableConfig):
@@ -115,63 +353,49 @@ async def business_conversation_node(state: BusinessCanvasState, config: Runnabl
     results that were processed in the previous workflow step.
     """
     summary = state.get("summary", "")
-    conversation_chain = get_business_expert_response_chain()
-
-    # Format user context for the prompt
-    user_context_section = ""
-    user_context_data = state.get("user_context")
-    if user_context_data:
-        try:
-            # Reconstruct BusinessUser from dict if needed
-            user = BusinessUser(**user_context_data)
-            user_context_section = BusinessUserFactory.format_user_context(user)
-        except Exception as e:
-            logger.error(f"Error reconstructing BusinessUser in workflow node: {e}")
-            user_context_section = "You're speaking with a business owner seeking guidance."
-    else:
-        user_context_section = BusinessUserFactory.format_user_context(None)
-
-    # Check if we need to process files - always use traced GenAI when files are present
-    pdf_base64 = _sanitize_base64(state.get("pdf_base64"))
-    image_base64 = _sanitize_base64(state.get("image_base64"))
-    pdf_name = state.get("pdf_name")
-    user_token = state.get("user_token")
-    
+    # The expert fields are static for a session, so they're pre-bound as
+    # prompt partials; per-turn input is just messages/summary/user context
+    conversation_chain = get_expert_response_chain_for(
+        state["expert_context"],
+        state["expert_name"],
+        state["expert_domain"],
+        state["expert_perspective"],
+        state["expert_style"],
+    )
+
+    # Format user context for the prompt (cached per stable profile)
+    user_context_section = _get_user_context_section(state.get("user_context"))
+
+    # Bound the history shipped to the model. The summarize node already keeps
+    # the stored history short, but between summarizations the window can grow
+    # past the trigger; the running summary covers anything trimmed here.
+    history = trim_messages(
+        state["messages"],
+        max_tokens=settings.TOTAL_MESSAGES_SUMMARY_TRIGGER,
+        token_counter=len,
+        strategy="last",
+        start_on="human",
+        allow_partial=False,
+    )
+
+    # file_processing_node already sanitized these and wrote them back to
+    # state, so read them directly instead of rescanning multi-MB payloads
+    pdf_base64 = state.get("pdf_base64")
+    image_base64 = state.get("image_base64")
+
     # If files are present, use LangChain's native multimodal support
     if pdf_base64 or image_base64:
         logger.info("Processing files with LangChain native support in conversation node")
         
         # Extract the last message content
-        last_message = state["messages"][-1] if state["messages"] else None
-        message_content = ""
-        if last_message and hasattr(last_message, 'content'):
-            if isinstance(last_message.content, str):
-                message_content = last_message.content
-            elif isinstance(last_message.content, list):
-                # Extract text from mixed content
-                for part in last_message.content:
-                    if isinstance(part, dict) and part.get("type") == "text":
-                        message_content = part["text"]
-                        break
-        
+        message_content = _extract_text(state["messages"][-1]) if state["messages"] else ""
+
         # Construct the message content list
-        content_parts = [{"type": "text", "text": message_content}]
-        
-        if pdf_base64:
-            content_parts.append({
-                "type": "file",
-                "base64": pdf_base64,
-                "mime_type": "application/pdf",
-            })
-            
-        if image_base64:
-            content_parts.append({
-                "type": "image_url",
-                "image_url": f"data:image/png;base64,{image_base64}",
-            })
-            
+        content_parts = await _build_content_parts(
+            message_content, pdf_base64, image_base64
+        )
+
         # Create a new HumanMessage with the multimodal content
-        from langchain_core.messages import HumanMessage
         multimodal_message = HumanMessage(content=content_parts)
         
         # Replace the last message with the multimodal one for this turn
@@ -183,16 +407,11 @@ async def business_conversation_node(state: BusinessCanvasState, config: Runnabl
         
         # Option 1: Use the existing chain but override the messages
         # The chain expects a list of messages. We'll replace the last one.
-        messages_for_chain = state["messages"][:-1] + [multimodal_message]
+        messages_for_chain = history[:-1] + [multimodal_message]
         
         response = await conversation_chain.ainvoke(
             {
                 "messages": messages_for_chain,
-                "expert_context": state["expert_context"],
-                "expert_name": state["expert_name"],
-                "expert_domain": state["expert_domain"],
-                "expert_perspective": state["expert_perspective"],
-                "expert_style": state["expert_style"],
                 "user_context_section": user_context_section,
                 "summary": summary,
             },
@@ -204,12 +423,7 @@ async def business_conversation_node(state: BusinessCanvasState, config: Runnabl
     # Regular conversation without files
     response = await conversation_chain.ainvoke(
         {
-            "messages": state["messages"],
-            "expert_context": state["expert_context"],
-            "expert_name": state["expert_name"],
-            "expert_domain": state["expert_domain"],
-            "expert_perspective": state["expert_perspective"],
-            "expert_style": state["expert_style"],
+            "messages": history,
             "user_context_section": user_context_section,
             "summary": summary,
         },
@@ -218,6 +432,31 @@ async def business_conversation_node(state: BusinessCanvasState, config: Runnabl
     
     return {"messages": response}
 
+def _text_only_messages(messages: list) -> list:
+    """Strip non-text content parts before summarization.
+
+    Multimodal messages carry file parts (base64 blobs, data URLs) that are
+    useless to the summary model and would dominate its token budget; keep
+    only the text so summarization stays cheap on the small model.
+    """
+    pruned = []
+    for message in messages:
+        content = message.content
+        if type(content) is str:
+            if content:
+                pruned.append(message)
+            continue
+        if isinstance(content, list):
+            text = " ".join(
+                part["text"]
+                for part in content
+                if isinstance(part, dict) and part.get("type") == "text" and part.get("text")
+            )
+            if text:
+                pruned.append(message.__class__(content=text))
+    return pruned
+
+
 async def business_summarize_conversation_node(state: BusinessCanvasState):
     """Business expert conversation summary node."""
     summary = state.get("summary", "")
@@ -225,15 +464,19 @@ async def business_summarize_conversation_node(state: BusinessCanvasState):
 
     response = await summary_chain.ainvoke(
         {
-            "messages": state["messages"],
+            "messages": _text_only_messages(state["messages"]),
             "expert_name": state["expert_name"],
             "summary": summary,
         }
     )
 
+    # islice avoids copying the head of the history just to read message IDs
+    cut = len(state["messages"]) - settings.TOTAL_MESSAGES_AFTER_SUMMARY
+    if cut <= 0:
+        return {"summary": response.content}
     delete_messages = [
         RemoveMessage(id=m.id) # type: ignore
-        for m in state["messages"][: -settings.TOTAL_MESSAGES_AFTER_SUMMARY]
+        for m in islice(state["messages"], cut)
     ]
     return {"summary": response.content, "messages": delete_messages}
 
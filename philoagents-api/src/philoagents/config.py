@@ -69,19 +69,25 @@ class Settings(BaseSettings):
 
 settings = Settings() # type: ignore
 
-# --- Export Settings to Environment Variables for LangChain Tracing ---
-# LangChain libraries rely on environment variables for tracing configuration.
-if settings.LANGSMITH_API_KEY:
-    os.environ["LANGCHAIN_API_KEY"] = settings.LANGSMITH_API_KEY
-    os.environ["LANGCHAIN_TRACING_V2"] = "true" if settings.LANGSMITH_TRACING else "false"
-    os.environ["LANGCHAIN_ENDPOINT"] = settings.LANGSMITH_ENDPOINT
-    os.environ["LANGCHAIN_PROJECT"] = settings.LANGSMITH_PROJECT
-    
-    # Ensure compatibility with different SDK versions
-    os.environ["LANGSMITH_API_KEY"] = settings.LANGSMITH_API_KEY
-    os.environ["LANGSMITH_TRACING"] = "true" if settings.LANGSMITH_TRACING else "false"
-    os.environ["LANGSMITH_ENDPOINT"] = settings.LANGSMITH_ENDPOINT
-    os.environ["LANGSMITH_PROJECT"] = settings.LANGSMITH_PROJECT
+
+def configure_langsmith() -> None:
+    """Export LangSmith settings as environment variables for LangChain tracing.
+
+    LangChain libraries rely on environment variables for tracing
+    configuration. Called explicitly from app startup so importing this
+    module stays side-effect-free beyond parsing settings.
+    """
+    if settings.LANGSMITH_API_KEY:
+        os.environ["LANGCHAIN_API_KEY"] = settings.LANGSMITH_API_KEY
+        os.environ["LANGCHAIN_TRACING_V2"] = "true" if settings.LANGSMITH_TRACING else "false"
+        os.environ["LANGCHAIN_ENDPOINT"] = settings.LANGSMITH_ENDPOINT
+        os.environ["LANGCHAIN_PROJECT"] = settings.LANGSMITH_PROJECT
+
+        # Ensure compatibility with different SDK versions
+        os.environ["LANGSMITH_API_KEY"] = settings.LANGSMITH_API_KEY
+        os.environ["LANGSMITH_TRACING"] = "true" if settings.LANGSMITH_TRACING else "false"
+        os.environ["LANGSMITH_ENDPOINT"] = settings.LANGSMITH_ENDPOINT
+        os.environ["LANGSMITH_PROJECT"] = settings.LANGSMITH_PROJECT
 
 
 logger.info(f"🔧 CONFIG LOADED: ENV={settings.ENV}")
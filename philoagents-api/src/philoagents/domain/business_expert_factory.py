@@ -1,8 +1,6 @@
-from philoagents.domain.exceptions import (
-    ExpertNameNotFound,
-    ExpertPerspectiveNotFound,
-    ExpertStyleNotFound,
-)
+import sys
+
+from philoagents.domain.exceptions import ExpertNameNotFound
 from philoagents.domain.business_expert import BusinessExpert
 
 BUSINESS_EXPERT_NAMES = {
@@ -41,25 +39,80 @@ BUSINESS_EXPERT_STYLES = {
     "cost_structure": "Carlos is a meticulous and pragmatic financial analyst who helps businesses understand all costs incurred to operate their business model. He covers cost drivers, cost structures, and strategies for achieving cost advantages and economies of scale. His goal is to help the user complete the 'Cost Structure' block by identifying all business expenses. He focuses exclusively on the costs incurred to operate, analyzing key cost drivers and opportunities for efficiency.",
 }
 
+# The redirect sentences are generated from these tables so the nine
+# perspectives can't drift out of sync as experts are renamed or added.
+# Note: the persona first names used in prompts differ from
+# BUSINESS_EXPERT_NAMES for channels (Chloe vs. Chris), and the redirect
+# label for value_propositions is the singular 'Value Proposition'.
+_EXPERT_FIRST_NAMES = {
+    "customer_segments": "Steven",
+    "value_propositions": "Victor",
+    "channels": "Chloe",
+    "customer_relationships": "Rita",
+    "revenue_streams": "Ryan",
+    "key_resources": "Rebecca",
+    "key_activities": "Alex",
+    "key_partnerships": "Parker",
+    "cost_structure": "Carlos",
+}
+
+_EXPERT_REDIRECT_DOMAINS = {**BUSINESS_EXPERT_DOMAINS, "value_propositions": "Value Proposition"}
+
+_EXPERT_PRONOUNS = {
+    "customer_segments": ("he", "his"),
+    "value_propositions": ("he", "his"),
+    "channels": ("she", "her"),
+    "customer_relationships": ("she", "her"),
+    "revenue_streams": ("he", "his"),
+    "key_resources": ("she", "her"),
+    "key_activities": ("he", "his"),
+    "key_partnerships": ("he", "his"),
+    "cost_structure": ("he", "his"),
+}
+
+
+def _build_perspective(expert_id: str) -> str:
+    """Compose the focus-and-redirect perspective for one expert."""
+    subject, possessive = _EXPERT_PRONOUNS[expert_id]
+    others = [
+        f"{_EXPERT_FIRST_NAMES[other]} for '{_EXPERT_REDIRECT_DOMAINS[other]}'"
+        for other in BUSINESS_EXPERT_NAMES
+        if other != expert_id
+    ]
+    redirects = ", ".join(others[:-1]) + f", or {others[-1]}"
+    return (
+        f"As {_EXPERT_FIRST_NAMES[expert_id]}, {subject} will state {possessive} "
+        f"focus is on '{_EXPERT_REDIRECT_DOMAINS[expert_id]}'. If the user asks "
+        f"about another topic, {subject} will redirect them to the appropriate "
+        f"expert: {redirects}."
+    )
+
+
 BUSINESS_EXPERT_PERSPECTIVES = {
-    "customer_segments": "As Steven, he will state his focus is on 'Customer Segments'. If the user asks about another topic, he will redirect them to the appropriate expert: Victor for 'Value Proposition', Chloe for 'Channels', Rita for 'Customer Relationships', Ryan for 'Revenue Streams', Rebecca for 'Key Resources', Alex for 'Key Activities', Parker for 'Key Partnerships', or Carlos for 'Cost Structure'.",
-    "value_propositions": "As Victor, he will state his focus is on 'Value Proposition'. If the user asks about another topic, he will redirect them to the appropriate expert: Steven for 'Customer Segments', Chloe for 'Channels', Rita for 'Customer Relationships', Ryan for 'Revenue Streams', Rebecca for 'Key Resources', Alex for 'Key Activities', Parker for 'Key Partnerships', or Carlos for 'Cost Structure'.",
-    "channels": "As Chloe, she will state her focus is on 'Channels'. If the user asks about another topic, she will redirect them to the appropriate expert: Steven for 'Customer Segments', Victor for 'Value Proposition', Rita for 'Customer Relationships', Ryan for 'Revenue Streams', Rebecca for 'Key Resources', Alex for 'Key Activities', Parker for 'Key Partnerships', or Carlos for 'Cost Structure'.",
-    "customer_relationships": "As Rita, she will state her focus is on 'Customer Relationships'. If the user asks about another topic, she will redirect them to the appropriate expert: Steven for 'Customer Segments', Victor for 'Value Proposition', Chloe for 'Channels', Ryan for 'Revenue Streams', Rebecca for 'Key Resources', Alex for 'Key Activities', Parker for 'Key Partnerships', or Carlos for 'Cost Structure'.",
-    "revenue_streams": "As Ryan, he will state his focus is on 'Revenue Streams'. If the user asks about another topic, he will redirect them to the appropriate expert: Steven for 'Customer Segments', Victor for 'Value Proposition', Chloe for 'Channels', Rita for 'Customer Relationships', Rebecca for 'Key Resources', Alex for 'Key Activities', Parker for 'Key Partnerships', or Carlos for 'Cost Structure'.",
-    "key_resources": "As Rebecca, she will state her focus is on 'Key Resources'. If the user asks about another topic, she will redirect them to the appropriate expert: Steven for 'Customer Segments', Victor for 'Value Proposition', Chloe for 'Channels', Rita for 'Customer Relationships', Ryan for 'Revenue Streams', Alex for 'Key Activities', Parker for 'Key Partnerships', or Carlos for 'Cost Structure'.",
-    "key_activities": "As Alex, he will state his focus is on 'Key Activities'. If the user asks about another topic, he will redirect them to the appropriate expert: Steven for 'Customer Segments', Victor for 'Value Proposition', Chloe for 'Channels', Rita for 'Customer Relationships', Ryan for 'Revenue Streams', Rebecca for 'Key Resources', Parker for 'Key Partnerships', or Carlos for 'Cost Structure'.",
-    "key_partnerships": "As Parker, he will state his focus is on 'Key Partnerships'. If the user asks about another topic, he will redirect them to the appropriate expert: Steven for 'Customer Segments', Victor for 'Value Proposition', Chloe for 'Channels', Rita for 'Customer Relationships', Ryan for 'Revenue Streams', Rebecca for 'Key Resources', Alex for 'Key Activities', or Carlos for 'Cost Structure'.",
-    "cost_structure": "As Carlos, he will state his focus is on 'Cost Structure'. If the user asks about another topic, he will redirect them to the appropriate expert: Steven for 'Customer Segments', Victor for 'Value Proposition', Chloe for 'Channels', Rita for 'Customer Relationships', Ryan for 'Revenue Streams', Rebecca for 'Key Resources', Alex for 'Key Activities', or Parker for 'Key Partnerships'.",
+    expert_id: _build_perspective(expert_id) for expert_id in BUSINESS_EXPERT_NAMES
 }
 
-AVAILABLE_BUSINESS_EXPERTS = list(BUSINESS_EXPERT_NAMES.keys())
+# Tuple, so the shared module-level roster cannot be mutated by callers
+AVAILABLE_BUSINESS_EXPERTS = tuple(BUSINESS_EXPERT_NAMES)
+
+# The expert roster is static, so the Pydantic instances are built (and
+# validated) once at import; get_expert becomes a dict lookup
+_EXPERT_CACHE: dict[str, BusinessExpert] = {
+    expert_id: BusinessExpert(
+        id=expert_id,
+        name=BUSINESS_EXPERT_NAMES[expert_id],
+        domain=BUSINESS_EXPERT_DOMAINS[expert_id],
+        perspective=BUSINESS_EXPERT_PERSPECTIVES[expert_id],
+        style=BUSINESS_EXPERT_STYLES[expert_id],
+    )
+    for expert_id in BUSINESS_EXPERT_NAMES
+}
 
 
 class BusinessExpertFactory:
     @staticmethod
     def get_expert(id: str) -> BusinessExpert:
-        """Creates a business expert instance based on the provided ID.
+        """Returns the business expert instance for the provided ID.
 
         Args:
             id (str): Identifier of the business expert to create
@@ -70,30 +123,20 @@ class BusinessExpertFactory:
         Raises:
             ValueError: If business expert ID is not found in configurations
         """
-        id_lower = id.lower()
-
-        if id_lower not in BUSINESS_EXPERT_NAMES:
-            raise ExpertNameNotFound(id_lower)
-
-        if id_lower not in BUSINESS_EXPERT_PERSPECTIVES:
-            raise ExpertPerspectiveNotFound(id_lower)
-
-        if id_lower not in BUSINESS_EXPERT_STYLES:
-            raise ExpertStyleNotFound(id_lower)
+        # Interned so the cache lookup hits the pointer-equality fast path
+        # for the nine ids HTTP clients keep resending
+        id_lower = sys.intern(id.lower())
 
-        return BusinessExpert(
-            id=id_lower,
-            name=BUSINESS_EXPERT_NAMES[id_lower],
-            domain=BUSINESS_EXPERT_DOMAINS[id_lower],
-            perspective=BUSINESS_EXPERT_PERSPECTIVES[id_lower],
-            style=BUSINESS_EXPERT_STYLES[id_lower],
-        )
+        try:
+            return _EXPERT_CACHE[id_lower]
+        except KeyError:
+            raise ExpertNameNotFound(id_lower) from None
 
     @staticmethod
-    def get_available_experts() -> list[str]:
-        """Returns a list of all available business expert IDs.
+    def get_available_experts() -> tuple[str, ...]:
+        """Returns all available business expert IDs.
 
         Returns:
-            list[str]: List of business expert IDs that can be instantiated
+            tuple[str, ...]: Business expert IDs that can be instantiated
         """
         return AVAILABLE_BUSINESS_EXPERTS
@@ -1,5 +1,5 @@
-from typing import List
-from pydantic import BaseModel, Field
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field
 import uuid
 
 
@@ -11,31 +11,62 @@ class BusinessUser(BaseModel):
         owner_name (str): Name of the business owner.
         business_name (str): Name of the business.
         sector (str): Industry sector.
-        challenges (List[str]): Current business challenges.
-        goals (List[str]): Business goals and objectives.
+        challenges (tuple[str, ...]): Current business challenges.
+        goals (tuple[str, ...]): Business goals and objectives.
     """
 
+    # Profiles are read-only after construction; freezing makes that explicit
+    # and keeps the cached context string trustworthy
+    model_config = ConfigDict(frozen=True)
+
     token: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Access token for this user profile")
     role: str = Field(default="user", description="User role (admin or user)")
     owner_name: str = Field(description="Name of the business owner")
     business_name: str = Field(description="Name of the business")
     sector: str = Field(description="Industry sector")
-    challenges: List[str] = Field(description="Current business challenges")
-    goals: List[str] = Field(description="Business goals and objectives")
+    challenges: tuple[str, ...] = Field(description="Current business challenges")
+    goals: tuple[str, ...] = Field(description="Business goals and objectives")
+
+    @property
+    def first_name(self) -> str:
+        """Owner's first name; partition stops at the first space without
+        allocating a list of all name parts."""
+        return self.owner_name.partition(" ")[0]
+
+    @cached_property
+    def context_string(self) -> str:
+        """Formatted context string, built once per instance.
+
+        The profile fields never change after construction, so the joins and
+        formatting run on first access only.
+        """
+        # Joined from trimmed lines so no indentation whitespace leaks into
+        # the rendered prompt (and into the model's token count)
+        return "\n".join([
+            "CLIENT PROFILE:",
+            f"Name: {self.owner_name} (your client)",
+            f"Business: {self.business_name}",
+            f"Sector: {self.sector}",
+            f"Current Challenges: {', '.join(self.challenges)}",
+            f"Business Goals: {', '.join(self.goals)}",
+            "",
+            f"Note: You are meeting with {self.first_name} for a business consultation.",
+            "They are your established client and you should know their name.",
+        ])
+
+    @cached_property
+    def context_dict(self) -> dict:
+        """model_dump() computed once per instance.
+
+        The factory's TTL cache hands the same instance to repeated requests,
+        so the per-request dump collapses to an attribute read. Callers must
+        treat the dict as read-only.
+        """
+        return self.model_dump()
 
     def to_context_string(self) -> str:
         """Convert the business user profile to a formatted context string."""
-        return f"""
-                CLIENT PROFILE:
-                Name: {self.owner_name} (your client)
-                Business: {self.business_name}
-                Sector: {self.sector}
-                Current Challenges: {', '.join(self.challenges)}
-                Business Goals: {', '.join(self.goals)}
-                
-                Note: You are meeting with {self.owner_name.split()[0]} for a business consultation. 
-                They are your established client and you should know their name.
-                """
+        return self.context_string
 
     def __str__(self) -> str:
         return f"BusinessUser(token={self.token}, business_name={self.business_name}, sector={self.sector})"
@@ -1,12 +1,13 @@
 import logging
 import asyncio
+import time
+import uuid
 from typing import Optional, List
 from urllib.parse import urlparse
 from philoagents.domain.business_user import BusinessUser
 from philoagents.config import settings
 from motor.motor_asyncio import AsyncIOMotorClient
 from pymongo.errors import DuplicateKeyError, ConnectionFailure, OperationFailure
-import threading
 import os
 
 # Configure logging
@@ -31,11 +32,23 @@ class UserAlreadyExistsError(Exception):
 
 # --- REMOVED HARDCODED DATA ---
 
+# Context string for requests without a resolved user profile
+_DEFAULT_USER_CONTEXT = "You're speaking with a general business owner seeking guidance."
+
 class BusinessUserFactory:
     _client: Optional[AsyncIOMotorClient] = None
     _collection = None
-    _lock = threading.Lock()
+    # asyncio.Lock: initialization awaits (ping, create_index) inside the
+    # critical section, and a thread lock held across awaits would stall the
+    # whole event loop
+    _init_lock = asyncio.Lock()
     _index_created = False
+    # Recently fetched users, shared across instances like the client itself.
+    # Profiles change rarely, so a short TTL trades one minute of staleness
+    # for skipping the Mongo round-trip on every conversation turn.
+    _user_cache: dict[str, tuple[float, BusinessUser]] = {}
+    _USER_CACHE_TTL = 60.0
+    _USER_CACHE_MAX = 1024
 
     @classmethod
     async def create_collection_with_index(cls):
@@ -49,7 +62,7 @@ class BusinessUserFactory:
             logger.info("Collection already initialized, skipping")
             return
             
-        with cls._lock:
+        async with cls._init_lock:
             if cls._index_created:  # Double-check pattern
                 logger.info("Collection already initialized (double-check), skipping")
                 return
@@ -59,7 +72,11 @@ class BusinessUserFactory:
                     logger.info("Creating new MongoDB client...")
                     cls._client = AsyncIOMotorClient(
                         settings.MONGODB_URI,
-                        serverSelectionTimeoutMS=5000  # 5 second timeout
+                        serverSelectionTimeoutMS=5000,  # 5 second timeout
+                        maxPoolSize=50,
+                        minPoolSize=5,  # Keep warm sockets through idle periods
+                        maxIdleTimeMS=60_000,
+                        waitQueueTimeoutMS=2000,  # Fail fast if the pool is exhausted
                     )
                     
                     # Test connection
@@ -83,6 +100,23 @@ class BusinessUserFactory:
                 logger.error(f"❌ Failed to initialize database: {e}")
                 raise DatabaseOperationError(f"Database initialization failed: {e}") from e
 
+    @classmethod
+    def _prune_user_cache(cls) -> None:
+        """Drop expired cache entries; clear outright if still over the cap."""
+        now = time.monotonic()
+        cls._user_cache = {
+            token: entry
+            for token, entry in cls._user_cache.items()
+            if now - entry[0] < cls._USER_CACHE_TTL
+        }
+        if len(cls._user_cache) >= cls._USER_CACHE_MAX:
+            cls._user_cache.clear()
+
+    @classmethod
+    def _invalidate_cached_user(cls, token: str) -> None:
+        """Remove a token from the user cache after a write."""
+        cls._user_cache.pop(token, None)
+
     def _get_collection(self):
         """Returns the database collection (after initialization)."""
         if self._collection is None:
@@ -103,18 +137,26 @@ class BusinessUserFactory:
         Raises:
             DatabaseOperationError: If database operation fails
         """
-        if not token or not isinstance(token, str):
+        if type(token) is not str or not token:
             logger.warning(f"Invalid token provided: {token}")
             return None
-            
+
+        cached = self._user_cache.get(token)
+        if cached and time.monotonic() - cached[0] < self._USER_CACHE_TTL:
+            return cached[1]
+
         try:
             collection = self._get_collection()
-            user_data = await collection.find_one({"token": token})
-            
+            # _id is projected out server-side, so the returned document is
+            # exactly the BusinessUser field set
+            user_data = await collection.find_one({"token": token}, {"_id": 0})
+
             if user_data:
-                # Remove MongoDB _id field before creating BusinessUser
-                user_data.pop('_id', None)
-                return BusinessUser(**user_data)
+                user = BusinessUser(**user_data)
+                if len(self._user_cache) >= self._USER_CACHE_MAX:
+                    self._prune_user_cache()
+                self._user_cache[token] = (time.monotonic(), user)
+                return user
             return None
             
         except OperationFailure as e:
@@ -137,14 +179,12 @@ class BusinessUserFactory:
         """
         try:
             collection = self._get_collection()
-            users = []
-            cursor = collection.find({})
-            
-            async for user_data in cursor:
-                # Remove MongoDB _id field before creating BusinessUser
-                user_data.pop('_id', None)
-                users.append(BusinessUser(**user_data))
-                
+            # Fetch in driver-sized batches instead of resuming the event
+            # loop once per document
+            docs = await collection.find({}, {"_id": 0}).to_list(length=None)
+            users = [BusinessUser(**user_data) for user_data in docs]
+
+
             logger.info(f"Retrieved {len(users)} users from database")
             return users
             
@@ -193,6 +233,7 @@ class BusinessUserFactory:
             # 2. Check if the insert operation returned a valid ID
             if result.inserted_id:
                 logger.info(f"✅ Successfully created user with token '{user.token}', inserted_id: {result.inserted_id}")
+                self._invalidate_cached_user(user.token)
                 return True
             else:
                 # 3. If not, the write failed silently. Raise an error.
@@ -226,7 +267,6 @@ class BusinessUserFactory:
         admin_data['role'] = 'admin'
         # Ensure token is present if not provided
         if 'token' not in admin_data:
-            import uuid
             admin_data['token'] = str(uuid.uuid4())
             
         return await self.create_user(BusinessUser(**admin_data))
@@ -259,7 +299,7 @@ class BusinessUserFactory:
         Raises:
             DatabaseOperationError: If database operation fails
         """
-        if not token or not isinstance(token, str):
+        if type(token) is not str or not token:
             raise ValueError("Invalid token provided")
             
         if not user_update_data or not isinstance(user_update_data, BusinessUser):
@@ -274,6 +314,7 @@ class BusinessUserFactory:
             
             if result.matched_count > 0:
                 logger.info(f"Successfully updated user with token '{token}'")
+                self._invalidate_cached_user(token)
             else:
                 logger.warning(f"No user found with token '{token}' to update")
                 
@@ -302,7 +343,7 @@ class BusinessUserFactory:
         Raises:
             DatabaseOperationError: If database operation fails
         """
-        if not token or not isinstance(token, str):
+        if type(token) is not str or not token:
             raise ValueError("Invalid token provided")
             
         try:
@@ -311,6 +352,7 @@ class BusinessUserFactory:
             
             if result.deleted_count > 0:
                 logger.info(f"Successfully deleted user with token '{token}'")
+                self._invalidate_cached_user(token)
             else:
                 logger.warning(f"No user found with token '{token}' to delete")
                 
@@ -340,20 +382,12 @@ class BusinessUserFactory:
         Raises:
             DatabaseOperationError: If database operation fails
         """
-        if not token or not isinstance(token, str):
+        if type(token) is not str or not token:
             return False
-            
-        try:
-            collection = self._get_collection()
-            count = await collection.count_documents({"token": token}, limit=1)
-            return count > 0
-            
-        except OperationFailure as e:
-            logger.error(f"Database operation failed while validating token '{token}': {e}")
-            raise DatabaseOperationError(f"Failed to validate token: {e}") from e
-        except Exception as e:
-            logger.error(f"Unexpected error while validating token '{token}': {e}")
-            raise DatabaseOperationError(f"Unexpected error validating token: {e}") from e
+
+        # Reuses the user cache, so warm validations skip the server hit and
+        # a subsequent get_user_by_token for the same token is free
+        return await self.get_user_by_token(token) is not None
 
     async def get_all_tokens(self) -> List[str]:
         """
@@ -367,15 +401,10 @@ class BusinessUserFactory:
         """
         try:
             collection = self._get_collection()
-            cursor = collection.find({}, {"token": 1, "_id": 0})
-            tokens = []
-            
-            async for doc in cursor:
-                token = doc.get("token")
-                if token:
-                    tokens.append(token)
-                    
-            return tokens
+            # Server-side distinct: one round-trip and one array decode
+            # instead of a cursor of per-document dicts
+            tokens = await collection.distinct("token")
+            return [token for token in tokens if token]
             
         except OperationFailure as e:
             logger.error(f"Database operation failed while fetching tokens: {e}")
@@ -396,7 +425,9 @@ class BusinessUserFactory:
         """
         try:
             collection = self._get_collection()
-            count = await collection.count_documents({})
+            # Metadata read instead of a collection scan; the count only
+            # feeds diagnostics, where approximate-after-crash is acceptable
+            count = await collection.estimated_document_count()
             return count
             
         except OperationFailure as e:
@@ -414,6 +445,7 @@ class BusinessUserFactory:
             cls._client = None
             cls._collection = None
             cls._index_created = False
+            cls._user_cache.clear()
             logger.info("MongoDB connections closed")
 
     @staticmethod
@@ -428,6 +460,7 @@ class BusinessUserFactory:
             Formatted context string
         """
         if not user:
-            return "You're speaking with a general business owner seeking guidance."
-        
+            return _DEFAULT_USER_CONTEXT
+
+        # Cached per profile instance, so repeat renders return the same str
         return user.to_context_string()
\ No newline at end of file
@@ -1,30 +1,35 @@
-class ExpertNameNotFound(Exception):
-    """Exception raised when a philosopher's name is not found."""
+class ExpertAttributeNotFound(Exception):
+    """Base exception raised when a philosopher attribute is not found.
+
+    Subclasses only override ``_attribute``; the message format is shared.
+    """
+
+    _attribute = "attribute"
 
     def __init__(self, philosopher_id: str):
-        self.message = f"Philosopher name for {philosopher_id} not found."
+        self.message = f"Philosopher {self._attribute} for {philosopher_id} not found."
         super().__init__(self.message)
 
 
-class ExpertPerspectiveNotFound(Exception):
+class ExpertNameNotFound(ExpertAttributeNotFound):
+    """Exception raised when a philosopher's name is not found."""
+
+    _attribute = "name"
+
+
+class ExpertPerspectiveNotFound(ExpertAttributeNotFound):
     """Exception raised when a philosopher's perspective is not found."""
 
-    def __init__(self, philosopher_id: str):
-        self.message = f"Philosopher perspective for {philosopher_id} not found."
-        super().__init__(self.message)
+    _attribute = "perspective"
 
 
-class ExpertStyleNotFound(Exception):
+class ExpertStyleNotFound(ExpertAttributeNotFound):
     """Exception raised when a philosopher's style is not found."""
 
-    def __init__(self, philosopher_id: str):
-        self.message = f"Philosopher style for {philosopher_id} not found."
-        super().__init__(self.message)
+    _attribute = "style"
 
 
-class ExpertContextNotFound(Exception):
+class ExpertContextNotFound(ExpertAttributeNotFound):
     """Exception raised when a philosopher's context is not found."""
 
-    def __init__(self, philosopher_id: str):
-        self.message = f"Philosopher context for {philosopher_id} not found."
-        super().__init__(self.message)
+    _attribute = "context"
@@ -1,11 +1,16 @@
 from contextlib import asynccontextmanager
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Optional
 import os
-from fastapi import FastAPI, HTTPException, Query, status
+from fastapi import FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from pydantic import BaseModel
 
+from philoagents.application.conversation_service.business_security import (
+    business_validator,
+)
 from philoagents.application.conversation_service.business_workflow_response import (
     get_business_response,
     get_business_streaming_response,
@@ -19,39 +24,83 @@ from philoagents.domain.business_user_factory import (
 )
 from philoagents.domain.business_user import BusinessUser
 
+import hashlib
+import json
 import logging
-from philoagents.config import settings
+from philoagents.config import configure_langsmith, settings
 from urllib.parse import urlparse
 
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 # Log MongoDB host to verify correct URI
 uri_host = urlparse(settings.MONGODB_URI).netloc
 logging.info(f"MongoDB host in use: {uri_host}")
 
 
+def _utc_timestamp() -> str:
+    """ISO-8601 UTC timestamp for diagnostic payloads."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _etag_for(body: bytes) -> str:
+    """Weak ETag derived from the response bytes, so invalidation is
+    automatic: any change to the body changes the tag."""
+    return f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+# Both factories are stateless (the Mongo client lives at class level), so one
+# shared instance per process replaces a per-request construction in every
+# endpoint
+expert_factory = BusinessExpertFactory()
+user_factory = BusinessUserFactory()
+
+# The expert roster is fixed per deployment, so the /business/experts body is
+# serialized once at import and served as prebuilt bytes
+_EXPERTS_BODY = json.dumps(
+    {
+        "experts": [
+            {
+                "id": expert.id,
+                "name": expert.name,
+                "domain": expert.domain,
+                "perspective": expert.perspective,
+                "style": expert.style,
+            }
+            for expert in map(
+                expert_factory.get_expert, expert_factory.get_available_experts()
+            )
+        ]
+    }
+).encode()
+_EXPERTS_ETAG = _etag_for(_EXPERTS_BODY)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Export LangSmith tracing variables before any request runs a chain
+    configure_langsmith()
     # Initialize database connection and create indexes
     try:
         await BusinessUserFactory.create_collection_with_index()
-        print("✅ BusinessUserFactory initialized successfully")
-    except Exception as e:
-        print(f"❌ Failed to initialize BusinessUserFactory: {e}")
+        logger.info("BusinessUserFactory initialized successfully")
+    except Exception:
+        logger.exception("Failed to initialize BusinessUserFactory")
         # You might want to fail startup if database is critical
         raise
     yield
     # Cleanup on shutdown
     try:
         await BusinessUserFactory.close_connections()
-        print("🔌 BusinessUserFactory connections closed")
+        logger.info("BusinessUserFactory connections closed")
     except Exception as e:
-        print(f"⚠️ Error closing database connections: {e}")
+        logger.warning("Error closing database connections: %s", e)
 
 
-app = FastAPI(lifespan=lifespan)
+# orjson serializes response bodies in C, which matters most for the larger
+# list payloads (admin user listing) and compounds with the prebuilt bodies
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 # CORS configuration - allow specific origins when credentials are enabled
 # Get allowed origins from environment or use defaults
@@ -88,8 +137,6 @@ async def health_check():
 async def database_diagnostics():
     """Diagnostic endpoint to check database connectivity and status."""
     try:
-        user_factory = BusinessUserFactory()
-        
         # Test connection by getting user count
         user_count = await user_factory.get_users_count()
         
@@ -107,7 +154,7 @@ async def database_diagnostics():
                 "user_count": user_count,
                 "users_loaded": len(users)
             },
-            "timestamp": __import__('datetime').datetime.utcnow().isoformat()
+            "timestamp": _utc_timestamp()
         }
     except DatabaseConnectionError as e:
         return {
@@ -116,7 +163,7 @@ async def database_diagnostics():
                 "connected": False,
                 "error": f"Connection error: {str(e)}"
             },
-            "timestamp": __import__('datetime').datetime.utcnow().isoformat()
+            "timestamp": _utc_timestamp()
         }
     except Exception as e:
         return {
@@ -125,7 +172,7 @@ async def database_diagnostics():
                 "connected": False,
                 "error": f"Unexpected error: {str(e)}"
             },
-            "timestamp": __import__('datetime').datetime.utcnow().isoformat()
+            "timestamp": _utc_timestamp()
         }
 #
 # --- END DIAGNOSTIC ENDPOINT ---
@@ -143,37 +190,36 @@ class BusinessChatMessage(BaseModel):
 async def business_chat(chat_message: BusinessChatMessage):
     """Chat with a Business Canvas expert."""
     try:
-        print(f"🔍 DEBUG: Received business chat request")
-        print(f"🔍 DEBUG: Message: {chat_message.message[:100]}...")
-        print(f"🔍 DEBUG: Expert ID: {chat_message.expert_id}")
-        print(f"🔍 DEBUG: User token: {chat_message.user_token}")
-        print(f"🔍 DEBUG: Has image: {bool(chat_message.image_base64)}")
-        print(f"🔍 DEBUG: Has PDF: {bool(chat_message.pdf_base64)}")
+        # Lazy %-formatting defers all string work unless DEBUG is enabled
+        logger.debug("Received business chat request")
+        logger.debug("Message: %.100s...", chat_message.message)
+        logger.debug("Expert ID: %s", chat_message.expert_id)
+        logger.debug("User token: %s", chat_message.user_token)
+        logger.debug("Has image: %s", bool(chat_message.image_base64))
+        logger.debug("Has PDF: %s", bool(chat_message.pdf_base64))
         if chat_message.pdf_name:
-            print(f"🔍 DEBUG: PDF name: {chat_message.pdf_name}")
+            logger.debug("PDF name: %s", chat_message.pdf_name)
         if chat_message.pdf_base64:
-            print(f"🔍 DEBUG: PDF base64 length: {len(chat_message.pdf_base64)}")
-        
-        expert_factory = BusinessExpertFactory()
+            logger.debug("PDF base64 length: %d", len(chat_message.pdf_base64))
+
         expert = expert_factory.get_expert(chat_message.expert_id)
-        print(f"🔍 DEBUG: Got expert: {expert.name} ({expert.domain})")
+        logger.debug("Got expert: %s (%s)", expert.name, expert.domain)
 
         # Get user context if token provided
         user_context = None
         if chat_message.user_token:
             try:
-                user_factory = BusinessUserFactory()
                 user = await user_factory.get_user_by_token(chat_message.user_token)
                 if user:
-                    user_context = user.model_dump()
-                    print(f"🔍 DEBUG: Got user context for: {user_context.get('business_name', 'Unknown')}")
+                    user_context = user.context_dict
+                    logger.debug("Got user context for: %s", user_context.get('business_name', 'Unknown'))
                 else:
-                    print(f"🔍 DEBUG: No user found with token: {chat_message.user_token}")
+                    logger.debug("No user found with token: %s", chat_message.user_token)
             except (DatabaseConnectionError, DatabaseOperationError) as e:
                 # Continue without user context if database issues occur
-                print(f"Warning: Could not retrieve user context: {e}")
+                logger.warning("Could not retrieve user context: %s", e)
 
-        print(f"🔍 DEBUG: Starting get_business_response call...")
+        logger.debug("Starting get_business_response call...")
         response, state = await get_business_response(
             messages=chat_message.message,
             expert_id=chat_message.expert_id,
@@ -188,47 +234,76 @@ async def business_chat(chat_message: BusinessChatMessage):
             pdf_base64=chat_message.pdf_base64,
             pdf_name=chat_message.pdf_name,
         )
-        print(f"🔍 DEBUG: get_business_response completed successfully")
-        print(f"🔍 DEBUG: Response length: {len(response)}")
+        logger.debug("get_business_response completed successfully")
+        logger.debug("Response length: %d", len(response))
         return {"response": response}
     except Exception as e:
-        print(f"❌ ERROR in business_chat: {len(str(e))} characters")
-        print(f"🔍 DEBUG: Error type: {type(e)}")
-        import traceback
-        print(f"🔍 DEBUG: Full traceback: {traceback.format_exc()}")
+        logger.exception("Error in business_chat")
+        raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/chat/business/stream")
+async def business_chat_stream(chat_message: BusinessChatMessage):
+    """Chat with a Business Canvas expert, streaming tokens as SSE events.
+
+    The buffered /chat/business route stays unchanged for existing clients;
+    this route trades waiting for the full completion for first-token
+    latency. File attachments are not processed in streaming mode.
+    """
+    try:
+        expert = expert_factory.get_expert(chat_message.expert_id)
+
+        user_context = None
+        if chat_message.user_token:
+            try:
+                user = await user_factory.get_user_by_token(chat_message.user_token)
+                if user:
+                    user_context = user.context_dict
+            except (DatabaseConnectionError, DatabaseOperationError) as e:
+                logger.warning("Could not retrieve user context: %s", e)
+
+        async def event_stream():
+            try:
+                async for chunk in get_business_streaming_response(
+                    messages=chat_message.message,
+                    expert_id=chat_message.expert_id,
+                    expert_name=expert.name,
+                    expert_domain=expert.domain,
+                    expert_perspective=expert.perspective,
+                    expert_style=expert.style,
+                    expert_context=f"Domain: {expert.domain}. Expertise: {expert.perspective}",
+                    user_token=chat_message.user_token,
+                    user_context=user_context,
+                ):
+                    yield f"data: {json.dumps({'delta': chunk})}\n\n"
+                yield "data: [DONE]\n\n"
+            except Exception:
+                # The status line is already sent, so surface the failure as
+                # an in-band event instead of a late 500
+                logger.exception("Error in business_chat_stream")
+                yield f"data: {json.dumps({'error': 'stream failed'})}\n\n"
+
+        return StreamingResponse(event_stream(), media_type="text/event-stream")
+    except Exception as e:
+        logger.exception("Error setting up business_chat_stream")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/business/experts")
-async def get_business_experts():
+async def get_business_experts(request: Request):
     """Get list of available business canvas experts."""
-    try:
-        expert_factory = BusinessExpertFactory()
-        expert_ids = expert_factory.get_available_experts()
-        
-        experts = []
-        for expert_id in expert_ids:
-            expert = expert_factory.get_expert(expert_id)
-            experts.append({
-                "id": expert.id,
-                "name": expert.name,
-                "domain": expert.domain,
-                "perspective": expert.perspective,
-                "style": expert.style,
-            })
-        
-        return {"experts": experts}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    headers = {"ETag": _EXPERTS_ETAG, "Cache-Control": "public, max-age=300"}
+    if request.headers.get("if-none-match") == _EXPERTS_ETAG:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=_EXPERTS_BODY, media_type="application/json", headers=headers
+    )
 
 
 @app.get("/business/tokens/validate")
 async def validate_token(token: str = Query(...)):
     """Validate a business user token."""
     try:
-        user_factory = BusinessUserFactory()
         is_valid = await user_factory.is_valid_token(token)
 
         if is_valid:
@@ -263,58 +338,50 @@ async def validate_token(token: str = Query(...)):
 @app.post("/business/user", status_code=status.HTTP_201_CREATED)
 async def create_business_user(user: BusinessUser):
     """Creates a new business user profile."""
-    print(f"=== RECEIVED CREATE USER REQUEST ===")
-    print(f"Request method: POST")
-    print(f"Request endpoint: /business/user")
-    print(f"User data received: {user.model_dump()}")
-    print(f"User token: {user.token}")
-    print(f"User business_name: {user.business_name}")
-    
+    # Lazy %-formatting keeps these free unless DEBUG is enabled
+    logger.debug("Received create user request")
+    logger.debug("User token: %s", user.token)
+    logger.debug("User business_name: %s", user.business_name)
+
     try:
-        print("Creating BusinessUserFactory instance...")
-        user_factory = BusinessUserFactory()
-        print("Calling user_factory.create_user()...")
         success = await user_factory.create_user(user)
-        print(f"user_factory.create_user() returned: {success}")
+        logger.debug("user_factory.create_user() returned: %s", success)
 
         if success:
-            print("✅ User creation successful, returning response")
             return {
                 "status": "success",
                 "message": f"User '{user.business_name}' created.",
                 "token": user.token
             }
         else:
-            print("❌ Database write operation failed silently")
+            logger.error("Database write operation failed silently")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Database write operation failed, but no exception was raised."
             )
     except UserAlreadyExistsError as e:
-        print(f"❌ UserAlreadyExistsError: {e}")
+        logger.warning("UserAlreadyExistsError: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
     except DatabaseConnectionError as e:
-        print(f"❌ DatabaseConnectionError: {e}")
+        logger.error("DatabaseConnectionError: %s", e)
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Database connection failed. Please try again later."
         )
     except DatabaseOperationError as e:
-        print(f"❌ DatabaseOperationError: {e}")
+        logger.error("DatabaseOperationError: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Database operation failed. Please try again."
         )
     except Exception as e:
-        print(f"❌ Unexpected error in create_business_user: {e}")
-        print(f"Error type: {type(e)}")
-        print(f"Error args: {e.args}")
-        import traceback
-        print(f"Traceback: {traceback.format_exc()}")
         if isinstance(e, HTTPException): raise e
+        # logger.exception formats the traceback lazily, only when the
+        # handler is enabled at ERROR level
+        logger.exception("Unexpected error in create_business_user")
         raise HTTPException(status_code=500, detail=str(e))
 
 # --- READ (All) ---
@@ -323,29 +390,29 @@ async def create_business_user(user: BusinessUser):
 # async def get_all_business_users():
 #     """Get a list of all business user profiles."""
 #     try:
-#         user_factory = BusinessUserFactory()
-#         users = await user_factory.get_all_users()
+# #         users = await user_factory.get_all_users()
 #         return users
 #     except Exception as e:
 #         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/admin/business/users", response_model=List[BusinessUser])
+@app.get("/admin/business/users")
 async def admin_get_all_business_users(admin_token: str = Query(...)):
     """Admin endpoint to view all business profiles"""
-    user_factory = BusinessUserFactory()
     if not user_factory.validate_admin_token(admin_token):
         raise HTTPException(status_code=401, detail="Admin access required")
-    
+
     try:
         users = await user_factory.get_all_users()
-        return users
+        # The models were validated on the way in from Mongo; returning the
+        # cached dumps skips response_model revalidating every item on the
+        # way out
+        return [user.context_dict for user in users]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/business/user/me", response_model=BusinessUser)
 async def get_my_business_profile(token: str = Query(...)):
     """Get ONLY the business profile for the provided token"""
-    user_factory = BusinessUserFactory()
     try:
         user = await user_factory.get_user_by_token(token)
         if user:
@@ -357,14 +424,24 @@ async def get_my_business_profile(token: str = Query(...)):
         raise HTTPException(status_code=500, detail=str(e))
 
 # --- READ (One) ---
-@app.get("/business/user/{token}", response_model=BusinessUser)
-async def get_business_user(token: str):
+@app.get("/business/user/{token}")
+async def get_business_user(token: str, request: Request):
     """Get a single business user profile by their token."""
     try:
-        user_factory = BusinessUserFactory()
         user = await user_factory.get_user_by_token(token)
         if user:
-            return user
+            # Content-derived ETag: a PUT/DELETE changes the body, hence the
+            # tag, so stale 304s can't outlive an update
+            body = json.dumps(user.context_dict).encode()
+            etag = _etag_for(body)
+            headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+            if request.headers.get("if-none-match") == etag:
+                return Response(
+                    status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+                )
+            return Response(
+                content=body, media_type="application/json", headers=headers
+            )
         else:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -389,7 +466,6 @@ async def get_business_user(token: str):
 async def update_business_user(token: str, user: BusinessUser):
     """Updates/Replaces a business user profile by their token."""
     try:
-        user_factory = BusinessUserFactory()
         
         if token != user.token:
             raise HTTPException(
@@ -398,8 +474,12 @@ async def update_business_user(token: str, user: BusinessUser):
             )
 
         success = await user_factory.update_user(token, user)
-        
+
         if success:
+            # The factory invalidates its own user cache; the validator's
+            # token cache guards file-processing validation and must not
+            # serve the pre-update profile for its remaining TTL
+            business_validator.invalidate_token(token)
             return {
                 "status": "success",
                 "message": f"User '{user.business_name}' (token: {token}) updated."
@@ -428,10 +508,12 @@ async def update_business_user(token: str, user: BusinessUser):
 async def delete_business_user(token: str):
     """Deletes a business user profile by their token."""
     try:
-        user_factory = BusinessUserFactory()
         success = await user_factory.delete_user(token)
-        
+
         if success:
+            # Without this, the deleted profile keeps passing file-processing
+            # validation until the validator's token cache TTL expires
+            business_validator.invalidate_token(token)
             return {
                 "status": "success",
                 "message": f"User with token '{token}' successfully deleted."
@@ -461,4 +543,15 @@ async def delete_business_user(token: str):
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop and httptools ship with uvicorn[standard] (via fastapi[standard])
+    # and move event-loop scheduling and HTTP parsing into C. Workers default
+    # to 1 because the in-process caches are per-worker; raise WEB_CONCURRENCY
+    # only when a single loop is saturated.
+    uvicorn.run(
+        "philoagents.infrastructure.api:app",
+        host="0.0.0.0",
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )